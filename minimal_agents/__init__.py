@@ -12,6 +12,7 @@ from minimal_agents.tools.base import Tool
 # Import LLM providers
 from minimal_agents.llm.base import LLMProvider
 from minimal_agents.llm.openai import OpenAIProvider
+from minimal_agents.llm.cache import LLMResponseCache
 
 # Import common tools
 from minimal_agents.tools.code.python_repl import PythonREPL
@@ -22,6 +23,7 @@ __all__ = [
     "Tool",
     "LLMProvider", 
     "OpenAIProvider",
+    "LLMResponseCache",
     "PythonREPL",
     "WebSearch"
 ]
\ No newline at end of file
@@ -1,25 +1,76 @@
 """Core agent implementation for MinimalAgents framework."""
 
+import asyncio
 import datetime
 import re
-from typing import List, Dict, Tuple, Any, Optional, Union
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Tuple, Any, Optional, Union
 
 from minimal_agents.llm.base import LLMProvider
 from minimal_agents.tools.base import Tool
-from minimal_agents.utils.parsing import extract_tool_calls, extract_final_answer
-from minimal_agents.utils.prompts import DEFAULT_SYSTEM_PROMPT, DEFAULT_PROMPT_TEMPLATE
+from minimal_agents.utils.parsing import (
+    ACTION_INPUT_TOKEN,
+    ACTION_TOKEN,
+    OBSERVATION_TOKEN,
+    THOUGHT_TOKEN,
+    TOOL_INPUT_STRIP,
+    ParsedResponse,
+    build_parser
+)
+# Not used here; re-exported for code that imported the tokens from this module
+from minimal_agents.utils.parsing import (  # noqa: F401
+    CHAT_RESPONSE_TOKEN,
+    FINAL_ANSWER_TOKEN,
+    PLAN_TOKEN
+)
+from minimal_agents.utils.prompts import (
+    DEFAULT_SYSTEM_PROMPT,
+    DEFAULT_PROMPT_TEMPLATE,
+    render_prompt,
+    split_prompt_template
+)
 
-# Response parsing tokens
-FINAL_ANSWER_TOKEN = "Final Answer:"
-OBSERVATION_TOKEN = "Observation:"
-THOUGHT_TOKEN = "Thought:"
-PLAN_TOKEN = "Plan:"
-ACTION_TOKEN = "Action:"
-ACTION_INPUT_TOKEN = "Action Input:"
-CHAT_RESPONSE_TOKEN = "Chat Response:"
+# Precompiled response pattern; each input ends at the next action so several calls can be found
+_MULTI_ACTION_RE = re.compile(
+    r"Action: \[?(.*?)\]?\n*Action Input:\s*(.*?)(?=\n\s*Action:|\n\s*Observation:|\Z)", re.DOTALL
+)
 
-class MinimalAgent(BaseModel):
+def _same_tools(snapshot: Tuple[Tool, ...], tools: List[Tool]) -> bool:
+    """Check whether a tool list still holds exactly the snapshotted tool objects.
+    
+    Args:
+        snapshot: Tools captured when the cache was built
+        tools: Current tool list
+        
+    Returns:
+        True if both contain the same objects in the same order
+    """
+    return len(snapshot) == len(tools) and all(
+        cached is tool for cached, tool in zip(snapshot, tools)
+    )
+
+def _segment_after(text: str, token: str) -> Optional[str]:
+    """Return the text between the first occurrence of a token and the next one.
+    
+    Equivalent to `text.split(token)[1]`, but only slices out the segment
+    instead of splitting the whole response into a list.
+    
+    Args:
+        text: The text to search
+        token: The delimiter token
+        
+    Returns:
+        The segment following the first token, or None if the token is absent
+    """
+    start = text.find(token)
+    if start == -1:
+        return None
+    start += len(token)
+    end = text.find(token, start)
+    return text[start:] if end == -1 else text[start:end]
+
+@dataclass
+class MinimalAgent:
     """Agent that orchestrates LLM interactions with tools.
     
     This agent manages the conversation flow, determines when to use tools,
@@ -27,32 +78,78 @@ class MinimalAgent(BaseModel):
     """
     
     llm: LLMProvider
-    tools: List[Tool] = Field(default_factory=list)
+    tools: List[Tool] = field(default_factory=list)
     system_prompt: str = DEFAULT_SYSTEM_PROMPT
     prompt_template: str = DEFAULT_PROMPT_TEMPLATE
     max_iterations: int = 10
     verbose: bool = False
-    stop_patterns: List[str] = Field(
+    stop_patterns: List[str] = field(
         default_factory=lambda: [f'\n{OBSERVATION_TOKEN}', f'\n\t{OBSERVATION_TOKEN}']
     )
     
-    class Config:
-        arbitrary_types_allowed = True
+    # (tools snapshot, descriptions, names, name -> tool mapping, response parser)
+    _tool_cache: Optional[
+        Tuple[Tuple[Tool, ...], str, str, Dict[str, Tool], Callable[[str], ParsedResponse]]
+    ] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        """Copy the tool list so the agent never shares it with the caller."""
+        self.tools = list(self.tools)
     
     @property
     def tool_descriptions(self) -> str:
         """Get formatted tool descriptions for prompt inclusion."""
-        return "\n".join([f"{tool.name}: {tool.description}" for tool in self.tools])
+        return self._get_tool_cache()[1]
 
     @property
     def tool_names(self) -> str:
         """Get comma-separated list of tool names."""
-        return ", ".join([tool.name for tool in self.tools])
+        return self._get_tool_cache()[2]
 
     @property
     def tool_by_name(self) -> Dict[str, Tool]:
         """Get dictionary mapping tool names to tool instances."""
-        return {tool.name: tool for tool in self.tools}
+        return self._get_tool_cache()[3]
+    
+    @property
+    def _parse_response(self) -> Callable[[str], ParsedResponse]:
+        """Get the response parser generated for the current tool set."""
+        return self._get_tool_cache()[4]
+    
+    def _get_tool_cache(
+        self
+    ) -> Tuple[Tuple[Tool, ...], str, str, Dict[str, Tool], Callable[[str], ParsedResponse]]:
+        """Get the cached tool metadata, rebuilding it if the tool list changed.
+        
+        The cache is cleared by `add_tool`/`remove_tool`; any other change to
+        `tools` (replacing the list, or adding, removing or replacing items)
+        is detected by comparing the tools by identity against a snapshot.
+        
+        Returns:
+            Tuple of (tools snapshot, descriptions, names, name -> tool
+            mapping, response parser)
+        """
+        cache = self._tool_cache
+        if cache is None or not _same_tools(cache[0], self.tools):
+            # Build every view of the tool list in a single pass
+            names = []
+            descriptions = []
+            by_name = {}
+            for tool in self.tools:
+                names.append(tool.name)
+                descriptions.extend((tool.name, ": ", tool.description, "\n"))
+                by_name[tool.name] = tool
+            cache = (
+                tuple(self.tools),
+                "".join(descriptions[:-1]),
+                ", ".join(names),
+                by_name,
+                build_parser(tuple(names))
+            )
+            self._tool_cache = cache
+        return cache
     
     def run(self, query: str) -> str:
         """Process a query and return the final response.
@@ -63,11 +160,16 @@ class MinimalAgent(BaseModel):
         Returns:
             The agent's final answer
         """
-        context = []  # Store conversation history
+        previous_responses = ""  # Conversation history, joined incrementally
+        observations = []  # Tool results, collected for the fallback summary
         iterations = 0
         
+        # The system prompt stays byte-identical for the whole run so providers can cache it
+        today = datetime.date.today()
+        system_prompt = self._format_system_prompt(today)
+        
         # Format the initial prompt
-        formatted_prompt = self._format_prompt(query, context)
+        formatted_prompt = self._format_prompt(query, today=today)
         
         # First check if this is a direct chat response that doesn't need tools
         if self.verbose:
@@ -75,17 +177,19 @@ class MinimalAgent(BaseModel):
             print(f"Available tools: {self.tool_names}")
             
         # Generate initial response
-        response = self.llm.generate(formatted_prompt, stop=self.stop_patterns)
+        response = self.llm.generate_with_system(
+            system_prompt, formatted_prompt, stop=self.stop_patterns
+        )
         
         # Check if the model decided to give a direct chat response
-        if CHAT_RESPONSE_TOKEN in response:
-            chat_response = response.split(CHAT_RESPONSE_TOKEN)[1].strip()
+        chat_response = self._parse_response(response).chat_response
+        if chat_response is not None:
             if self.verbose:
                 print(f"Direct chat response: {chat_response}")
             return chat_response
             
         # If we're here, we're in tool-using mode
-        context.append(response)
+        previous_responses = response
         
         while iterations < self.max_iterations:
             iterations += 1
@@ -95,11 +199,13 @@ class MinimalAgent(BaseModel):
             
             if iterations > 1:  # We already have the first response
                 # Format the prompt with the updated context
-                formatted_prompt = self._format_prompt(query, context)
-                response = self.llm.generate(formatted_prompt, stop=self.stop_patterns)
+                formatted_prompt = self._format_prompt(query, previous_responses, today)
+                response = self.llm.generate_with_system(
+                    system_prompt, formatted_prompt, stop=self.stop_patterns
+                )
                 
             # Extract tool name and input from response
-            tool_name, tool_input = self._extract_tool_call(response)
+            tool_name, tool_input, tool_index = self._extract_tool_call(response)
             
             # Check if we've reached a final answer
             if tool_name == "Final Answer":
@@ -113,133 +219,351 @@ class MinimalAgent(BaseModel):
                     print(f"Chat Response: {tool_input}")
                 return tool_input
             
-            # Execute the tool if found
-            if tool_name not in self.tool_by_name:
-                error_msg = f"Unknown tool: {tool_name}. Available tools: {self.tool_names}"
-                if self.verbose:
-                    print(f"Error: {error_msg}")
-                tool_result = f"Error: {error_msg}"
+            # Execute every tool call in the response, in order
+            tool_calls = self._extract_tool_calls(response)
+            if len(tool_calls) > 1:
+                tool_results = [
+                    self._execute_tool(name, tool_call_input) for name, tool_call_input in tool_calls
+                ]
             else:
-                try:
-                    if self.verbose:
-                        print(f"Using tool: {tool_name}")
-                        print(f"Tool input: {tool_input}")
-                    
-                    # Execute the tool and get result
-                    tool = self.tool_by_name[tool_name]
-                    tool_result = tool.run(tool_input)
-                    
-                    if self.verbose:
-                        # Truncate long results for display
-                        display_result = (
-                            f"{tool_result[:500]}..." if len(tool_result) > 500 else tool_result
-                        )
-                        print(f"Tool result: {display_result}")
-                except Exception as e:
-                    tool_result = f"Error: {str(e)}"
-                    if self.verbose:
-                        print(f"Tool execution error: {str(e)}")
-            
-            # Add the observation and prepare for next iteration
-            response += f"\n{OBSERVATION_TOKEN} {tool_result}\n{THOUGHT_TOKEN}"
-            context.append(response)
+                tool_results = [self._execute_tool(tool_name, tool_input, tool_index)]
+            
+            # Add the observations and prepare for next iteration
+            for tool_result in tool_results:
+                observations.append(tool_result.strip())
+                response += f"\n{OBSERVATION_TOKEN} {tool_result}"
+            response += f"\n{THOUGHT_TOKEN}"
+            previous_responses += "\n" + response
         
         # If we reach max iterations without a final answer
         if self.verbose:
             print("\nReached maximum iterations without final answer")
             
         # Extract insights from all collected observations
-        insights = self._extract_insights(context)
+        insights = self._extract_insights(observations)
+        return f"I wasn't able to reach a definite conclusion after multiple attempts. Here's what I found: {insights}"
+    
+    async def arun(self, query: str) -> str:
+        """Asynchronously process a query and return the final response.
+        
+        Mirrors `run`, but awaits the LLM provider's `agenerate` so that many
+        queries can share one event loop while waiting on the network.
+        
+        Args:
+            query: The user's question or request
+            
+        Returns:
+            The agent's final answer
+        """
+        previous_responses = ""  # Conversation history, joined incrementally
+        observations = []  # Tool results, collected for the fallback summary
+        iterations = 0
+        
+        # The system prompt stays byte-identical for the whole run so providers can cache it
+        today = datetime.date.today()
+        system_prompt = self._format_system_prompt(today)
+        
+        # Format the initial prompt
+        formatted_prompt = self._format_prompt(query, today=today)
+        
+        if self.verbose:
+            print(f"Running agent with query: {query}")
+            print(f"Available tools: {self.tool_names}")
+            
+        # Generate initial response
+        response = await self.llm.agenerate_with_system(
+            system_prompt, formatted_prompt, stop=self.stop_patterns
+        )
+        
+        # Check if the model decided to give a direct chat response
+        chat_response = self._parse_response(response).chat_response
+        if chat_response is not None:
+            if self.verbose:
+                print(f"Direct chat response: {chat_response}")
+            return chat_response
+            
+        # If we're here, we're in tool-using mode
+        previous_responses = response
+        
+        while iterations < self.max_iterations:
+            iterations += 1
+            
+            if self.verbose:
+                print(f"\n--- Iteration {iterations} ---")
+            
+            if iterations > 1:  # We already have the first response
+                formatted_prompt = self._format_prompt(query, previous_responses, today)
+                response = await self.llm.agenerate_with_system(
+                    system_prompt, formatted_prompt, stop=self.stop_patterns
+                )
+                
+            # Extract tool name and input from response
+            tool_name, tool_input, tool_index = self._extract_tool_call(response)
+            
+            if tool_name in ("Final Answer", "Chat Response"):
+                if self.verbose:
+                    print(f"{tool_name}: {tool_input}")
+                return tool_input
+            
+            # Execute every tool call in the response, as in `run`
+            tool_calls = self._extract_tool_calls(response)
+            if len(tool_calls) > 1 and len({name for name, _ in tool_calls}) == len(tool_calls):
+                # Calls to different tools are treated as independent and run concurrently
+                tool_results = await asyncio.gather(
+                    *(self._aexecute_tool(name, tool_call_input) for name, tool_call_input in tool_calls)
+                )
+            elif len(tool_calls) > 1:
+                # Repeated calls to one tool may depend on each other (e.g. REPL state)
+                tool_results = [
+                    await self._aexecute_tool(name, tool_call_input) for name, tool_call_input in tool_calls
+                ]
+            else:
+                tool_results = [await self._aexecute_tool(tool_name, tool_input, tool_index)]
+            
+            # Add the observations and prepare for next iteration
+            for tool_result in tool_results:
+                observations.append(tool_result.strip())
+                response += f"\n{OBSERVATION_TOKEN} {tool_result}"
+            response += f"\n{THOUGHT_TOKEN}"
+            previous_responses += "\n" + response
+        
+        if self.verbose:
+            print("\nReached maximum iterations without final answer")
+            
+        insights = self._extract_insights(observations)
         return f"I wasn't able to reach a definite conclusion after multiple attempts. Here's what I found: {insights}"
     
-    def _format_prompt(self, query: str, context: List[str] = None) -> str:
-        """Format the prompt with query and context.
+    async def run_many(self, queries: List[str], max_concurrency: int = 4) -> List[str]:
+        """Process several queries concurrently.
+        
+        Args:
+            queries: The questions or requests to process
+            max_concurrency: Maximum number of queries in flight at once
+            
+        Returns:
+            The final answers, in the same order as `queries`
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_one(query: str) -> str:
+            async with semaphore:
+                return await self.arun(query)
+        
+        return await asyncio.gather(*(run_one(query) for query in queries))
+    
+    def _execute_tool(self, tool_name: str, tool_input: str, tool_index: Optional[int] = None) -> str:
+        """Run a tool by name and return its result as an observation.
+        
+        Args:
+            tool_name: Name of the tool to run
+            tool_input: Input text for the tool
+            tool_index: Position of the tool in `tools` if already known
+            
+        Returns:
+            The tool's output, or an error message if the tool is unknown or fails
+        """
+        tool = self._resolve_tool(tool_name, tool_index)
+        if tool is None:
+            error_msg = f"Unknown tool: {tool_name}. Available tools: {self.tool_names}"
+            if self.verbose:
+                print(f"Error: {error_msg}")
+            return f"Error: {error_msg}"
+        
+        try:
+            if self.verbose:
+                print(f"Using tool: {tool_name}")
+                print(f"Tool input: {tool_input}")
+            
+            # Execute the tool and get result
+            tool_result = tool.run(tool_input)
+            
+            if self.verbose:
+                # Truncate long results for display
+                display_result = (
+                    f"{tool_result[:500]}..." if len(tool_result) > 500 else tool_result
+                )
+                print(f"Tool result: {display_result}")
+        except Exception as e:
+            tool_result = f"Error: {str(e)}"
+            if self.verbose:
+                print(f"Tool execution error: {str(e)}")
+        
+        return tool_result
+    
+    async def _aexecute_tool(
+        self,
+        tool_name: str,
+        tool_input: str,
+        tool_index: Optional[int] = None
+    ) -> str:
+        """Asynchronously run a tool by name and return its result as an observation.
+        
+        Args:
+            tool_name: Name of the tool to run
+            tool_input: Input text for the tool
+            tool_index: Position of the tool in `tools` if already known
+            
+        Returns:
+            The tool's output, or an error message if the tool is unknown or fails
+        """
+        tool = self._resolve_tool(tool_name, tool_index)
+        if tool is None:
+            error_msg = f"Unknown tool: {tool_name}. Available tools: {self.tool_names}"
+            if self.verbose:
+                print(f"Error: {error_msg}")
+            return f"Error: {error_msg}"
+        
+        try:
+            if self.verbose:
+                print(f"Using tool: {tool_name}")
+                print(f"Tool input: {tool_input}")
+            
+            tool_result = await tool.arun(tool_input)
+            
+            if self.verbose:
+                display_result = (
+                    f"{tool_result[:500]}..." if len(tool_result) > 500 else tool_result
+                )
+                print(f"Tool result: {display_result}")
+        except Exception as e:
+            tool_result = f"Error: {str(e)}"
+            if self.verbose:
+                print(f"Tool execution error: {str(e)}")
+        
+        return tool_result
+    
+    def _resolve_tool(self, tool_name: str, tool_index: Optional[int]) -> Optional[Tool]:
+        """Find the tool to run, by index when the parser matched its name.
+        
+        Args:
+            tool_name: Name of the tool to run
+            tool_index: `ParsedResponse.tool_index`, or None if not known
+            
+        Returns:
+            The tool, or None if no tool has this name
+        """
+        # The index is only trusted while it still points at a tool with this name
+        if tool_index is not None and tool_index < len(self.tools):
+            tool = self.tools[tool_index]
+            if tool.name == tool_name:
+                return tool
+        return self.tool_by_name.get(tool_name)
+    
+    def _format_system_prompt(self, today: Optional[datetime.date] = None) -> str:
+        """Format the static part of the prompt shared by every iteration of a run.
+        
+        This is the system prompt followed by the template text before the
+        question (date, tool descriptions, tool names).
+        
+        Args:
+            today: Date to show in the prompt (defaults to today)
+            
+        Returns:
+            Formatted system prompt string
+        """
+        prefix_template, _ = split_prompt_template(self.prompt_template)
+        prefix = render_prompt(
+            prefix_template,
+            today=today or datetime.date.today(),
+            tool_description=self.tool_descriptions,
+            tool_names=self.tool_names
+        )
+        system_prompt = f"{self.system_prompt.strip()}\n{prefix}"
+        
+        # Normalize trailing whitespace so the prefix is byte-identical across calls
+        return "\n".join(line.rstrip() for line in system_prompt.split("\n"))
+    
+    def _format_prompt(
+        self,
+        query: str,
+        previous_responses: str = "",
+        today: Optional[datetime.date] = None
+    ) -> str:
+        """Format the per-iteration part of the prompt with query and context.
         
         Args:
             query: The user's question
-            context: List of previous responses/context
+            previous_responses: Newline-joined previous responses/context
+            today: Date to show in the prompt (defaults to today)
             
         Returns:
             Formatted prompt string
         """
-        if context is None:
-            context = []
-            
-        # Format the prompt template with today's date, tool descriptions, etc.
-        prompt = self.prompt_template.format(
-            today=datetime.date.today(),
+        _, suffix_template = split_prompt_template(self.prompt_template)
+        prompt = render_prompt(
+            suffix_template,
+            today=today or datetime.date.today(),
             tool_description=self.tool_descriptions,
             tool_names=self.tool_names,
             question=query,
-            previous_responses="\n".join(context)
+            previous_responses=previous_responses
         )
         
         return prompt
     
-    def _extract_tool_call(self, response: str) -> Tuple[str, str]:
+    def _extract_tool_call(self, response: str) -> Tuple[str, str, Optional[int]]:
         """Extract the tool call and input from LLM response.
         
         Args:
             response: The raw LLM response text
             
         Returns:
-            Tuple of (tool_name, tool_input)
+            Tuple of (tool_name, tool_input, tool_index), where tool_index is
+            the tool's position in `tools`, or None if it was not matched
         """
+        parsed = self._parse_response(response)
+        
         # Check for final answer
-        if FINAL_ANSWER_TOKEN in response:
-            final_answer = response.split(FINAL_ANSWER_TOKEN)[1].strip()
-            return "Final Answer", final_answer
+        if parsed.final_answer is not None:
+            return "Final Answer", parsed.final_answer, None
             
         # Check for chat response
-        if CHAT_RESPONSE_TOKEN in response:
-            chat_response = response.split(CHAT_RESPONSE_TOKEN)[1].strip()
-            return "Chat Response", chat_response
-            
-        # Extract action and action input with regex
-        action_regex = r"Action: [\[]?(.*?)[\]]?[\n]*Action Input:[\s]*(.*)"
-        match = re.search(action_regex, response, re.DOTALL)
+        if parsed.chat_response is not None:
+            return "Chat Response", parsed.chat_response, None
         
-        if not match:
+        if parsed.tool_name is None:
             # If no clear action is detected, try alternative parsing
-            if ACTION_TOKEN in response and ACTION_INPUT_TOKEN in response:
-                try:
-                    action_part = response.split(ACTION_TOKEN)[1].split("\n")[0].strip()
-                    if OBSERVATION_TOKEN in response:
-                        input_part = response.split(ACTION_INPUT_TOKEN)[1].split(OBSERVATION_TOKEN)[0].strip()
-                    else:
-                        input_part = response.split(ACTION_INPUT_TOKEN)[1].strip()
-                    return action_part, input_part
-                except Exception:
-                    pass
+            action_part = _segment_after(response, ACTION_TOKEN)
+            input_part = _segment_after(response, ACTION_INPUT_TOKEN)
+            if action_part is not None and input_part is not None:
+                newline_idx = action_part.find("\n")
+                if newline_idx != -1:
+                    action_part = action_part[:newline_idx]
+                observation_idx = input_part.find(OBSERVATION_TOKEN)
+                if observation_idx != -1:
+                    input_part = input_part[:observation_idx]
+                return action_part.strip(), input_part.strip(), None
             
             # If parsing fails, raise error
             raise ValueError(f"Could not parse tool call from response: {response}")
         
-        tool_name = match.group(1).strip()
-        tool_input = match.group(2).strip(" \n\"'")
-        return tool_name, tool_input
+        return parsed.tool_name, parsed.tool_input, parsed.tool_index
     
-    def _extract_insights(self, context: List[str]) -> str:
+    def _extract_tool_calls(self, response: str) -> List[Tuple[str, str]]:
+        """Extract every tool call from an LLM response.
+        
+        Args:
+            response: The raw LLM response text
+            
+        Returns:
+            List of (tool_name, tool_input) tuples, in the order they appear
+        """
+        return [
+            (name.strip(), tool_input.strip(TOOL_INPUT_STRIP))
+            for name, tool_input in _MULTI_ACTION_RE.findall(response)
+        ]
+    
+    def _extract_insights(self, observations: List[str]) -> str:
         """Extract key insights from observations when no final answer is reached.
         
         Args:
-            context: List of all previous responses
+            observations: Tool results collected during the run
             
         Returns:
             String with extracted insights
         """
-        combined = "\n".join(context)
-        observations = []
-        
-        # Extract all observations using regex
-        observation_pattern = f"{OBSERVATION_TOKEN}(.*?)(?={THOUGHT_TOKEN}|$)"
-        matches = re.findall(observation_pattern, combined, re.DOTALL)
-        
         # Get the most important observations (last 3)
-        for match in matches[-3:]:
-            observations.append(match.strip())
-        
-        return "\n\n".join(observations)
+        return "\n\n".join(observations[-3:])
     
     def add_tool(self, tool: Tool) -> None:
         """Add a new tool to the agent.
@@ -248,6 +572,7 @@ class MinimalAgent(BaseModel):
             tool: The tool to add
         """
         self.tools.append(tool)
+        self._tool_cache = None
     
     def remove_tool(self, tool_name: str) -> bool:
         """Remove a tool by name.
@@ -260,6 +585,7 @@ class MinimalAgent(BaseModel):
         """
         original_count = len(self.tools)
         self.tools = [tool for tool in self.tools if tool.name != tool_name]
+        self._tool_cache = None
         return len(self.tools) < original_count
     
     @classmethod
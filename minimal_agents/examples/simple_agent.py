@@ -1,6 +1,8 @@
 """Example usage of MinimalAgents framework with basic tools."""
 
+import asyncio
 import os
+
 from dotenv import load_dotenv
 
 from minimal_agents.agent import MinimalAgent
@@ -8,10 +10,28 @@ from minimal_agents.llm.openai import OpenAIProvider
 from minimal_agents.tools.code.python_repl import PythonREPL
 from minimal_agents.tools.web.search import WebSearch
 
+try:
+    import aioconsole
+except ImportError:  # Optional dependency (pip install "minimal_agents[async]")
+    aioconsole = None
+
 # Load environment variables from .env file
 load_dotenv()
 
-def main():
+async def ainput(prompt: str) -> str:
+    """Read a line of user input without blocking the event loop.
+    
+    Args:
+        prompt: Text shown before the input
+        
+    Returns:
+        The line entered by the user
+    """
+    if aioconsole is not None:
+        return await aioconsole.ainput(prompt)
+    return await asyncio.to_thread(input, prompt)
+
+async def main():
     """Run a simple agent example."""
     
     # Create LLM provider
@@ -46,8 +66,8 @@ def main():
     
     # Simple chat loop
     while True:
-        # Get user input
-        query = input("\nYou: ")
+        # Get user input without blocking the event loop
+        query = await ainput("\nYou: ")
         
         # Check for exit command
         if query.lower() in ["exit", "quit", "bye"]:
@@ -56,10 +76,10 @@ def main():
             
         # Run the agent
         try:
-            result = agent.run(query)
+            result = await agent.arun(query)
             print(f"\nAgent: {result}")
         except Exception as e:
             print(f"\nError: {str(e)}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
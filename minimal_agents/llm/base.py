@@ -1,5 +1,6 @@
 """Base LLM provider interface for the MinimalAgents framework."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
 
@@ -23,6 +24,61 @@ class LLMProvider(ABC):
         """
         pass
     
+    async def agenerate(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        """Asynchronously generate text from a prompt.
+        
+        Providers without a native async client fall back to running
+        `generate` in a worker thread so the event loop is never blocked.
+        
+        Args:
+            prompt: The prompt to send to the language model
+            stop: Optional list of strings that will stop generation if encountered
+            
+        Returns:
+            The generated text as a string
+        """
+        return await asyncio.to_thread(self.generate, prompt, stop)
+    
+    def generate_with_system(
+        self,
+        system_prompt: str,
+        prompt: str,
+        stop: Optional[List[str]] = None
+    ) -> str:
+        """Generate text from static system instructions and a per-request prompt.
+        
+        Keeping the system part byte-identical across calls lets providers
+        with prefix caching reuse it. Providers that support system messages
+        should override this; the default sends both parts as one prompt.
+        
+        Args:
+            system_prompt: Static instructions shared across requests
+            prompt: The per-request prompt
+            stop: Optional list of strings that will stop generation if encountered
+            
+        Returns:
+            The generated text as a string
+        """
+        return self.generate(f"{system_prompt.rstrip()}\n\n{prompt}", stop)
+    
+    async def agenerate_with_system(
+        self,
+        system_prompt: str,
+        prompt: str,
+        stop: Optional[List[str]] = None
+    ) -> str:
+        """Asynchronously generate text from static system instructions and a per-request prompt.
+        
+        Args:
+            system_prompt: Static instructions shared across requests
+            prompt: The per-request prompt
+            stop: Optional list of strings that will stop generation if encountered
+            
+        Returns:
+            The generated text as a string
+        """
+        return await self.agenerate(f"{system_prompt.rstrip()}\n\n{prompt}", stop)
+    
     @property
     @abstractmethod
     def provider_name(self) -> str:
@@ -0,0 +1,102 @@
+"""Response cache for LLM providers."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+class LLMResponseCache:
+    """LRU cache with per-entry expiry for LLM completions.
+    
+    Entries are keyed by a hash of everything that influences the output
+    (messages, model, temperature, stop sequences and token limit), so only
+    truly identical requests are served from the cache. Caching is most
+    useful with a temperature of 0, where the output is deterministic.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of responses to keep
+            ttl: Time in seconds before a cached response expires
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        stop: Optional[List[str]] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Build a cache key for a generation request.
+        
+        Args:
+            messages: The chat messages sent to the model
+            model: The model name
+            temperature: Temperature setting for generation
+            stop: Optional list of stop sequences
+            max_tokens: Maximum tokens to generate
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {"p": messages, "m": model, "t": temperature, "s": stop, "max": max_tokens},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response.
+        
+        Args:
+            key: Cache key from `make_key`
+        
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+    
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key from `make_key`
+            value: The generated response
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached responses and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        """Return the number of cached responses (including expired ones not yet evicted)."""
+        return len(self._entries)
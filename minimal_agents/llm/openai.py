@@ -1,12 +1,65 @@
 """OpenAI LLM provider implementation."""
 
+import importlib.util
 import os
 from typing import List, Optional, Dict, Any
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 from pydantic import Field
 
 from minimal_agents.llm.base import LLMProvider
+from minimal_agents.llm.cache import LLMResponseCache
+from minimal_agents.utils.aiohttp_session import LoopBoundSession
+from minimal_agents.utils.serialization import loads
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency for the aiohttp fast path
+    aiohttp = None
+
+CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+
+# HTTP/2 lets concurrent async calls share one multiplexed connection; httpx needs `h2` for it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+class _StopDetector:
+    """Accumulate streamed text and cut it at the first stop sequence."""
+    
+    def __init__(self, stop: Optional[List[str]] = None):
+        """Initialize the detector.
+        
+        Args:
+            stop: Optional list of strings that end the generation
+        """
+        self.stop = stop or []
+        # A stop sequence can straddle two chunks, so rescan this much old text
+        self._overlap = max((len(s) for s in self.stop), default=1) - 1
+        self.text = ""
+    
+    def feed(self, delta: str) -> bool:
+        """Append a streamed chunk.
+        
+        Args:
+            delta: Newly received text
+            
+        Returns:
+            True if a stop sequence was found; `text` is then truncated before it
+        """
+        start = max(0, len(self.text) - self._overlap)
+        self.text += delta
+        
+        cut = -1
+        for stop_sequence in self.stop:
+            idx = self.text.find(stop_sequence, start)
+            if idx != -1 and (cut == -1 or idx < cut):
+                cut = idx
+        if cut == -1:
+            return False
+        
+        self.text = self.text[:cut]
+        return True
 
 class OpenAIProvider(LLMProvider):
     """OpenAI API provider for language models."""
@@ -16,6 +69,11 @@ class OpenAIProvider(LLMProvider):
     max_tokens: Optional[int] = None
     api_key: Optional[str] = None
     client: Optional[Any] = None
+    aclient: Optional[Any] = None
+    use_aiohttp: bool = False
+    cache: Optional[LLMResponseCache] = None
+    stream: bool = False
+    _aiohttp_sessions: Optional[LoopBoundSession] = None
     
     def __init__(
         self,
@@ -23,6 +81,9 @@ class OpenAIProvider(LLMProvider):
         temperature: float = 0.4,
         max_tokens: Optional[int] = None,
         api_key: Optional[str] = None,
+        use_aiohttp: bool = False,
+        cache: Optional[LLMResponseCache] = None,
+        stream: bool = False,
         **kwargs
     ):
         """Initialize the OpenAI provider.
@@ -32,17 +93,39 @@ class OpenAIProvider(LLMProvider):
             temperature: Temperature setting for generation (0.0 to 1.0)
             max_tokens: Maximum tokens to generate (optional)
             api_key: OpenAI API key (will use OPENAI_API_KEY env var if not provided)
+            use_aiohttp: Send async requests with aiohttp instead of the official
+                client, which scales better under high concurrency
+            cache: Optional response cache; identical requests are answered
+                from it instead of calling the API
+            stream: Stream completions and match stop sequences on the client,
+                closing the stream as soon as one appears
         """
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.use_aiohttp = use_aiohttp
+        self.cache = cache
+        self.stream = stream
         
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass api_key.")
         
-        # Initialize the client
-        self.client = OpenAI(api_key=self.api_key)
+        if self.use_aiohttp and aiohttp is None:
+            raise ImportError("aiohttp is required for use_aiohttp=True. Install it with `pip install aiohttp`.")
+        
+        # One pooled session per provider, so closing it never affects other providers
+        self._aiohttp_sessions = LoopBoundSession(limit=128, limit_per_host=64)
+        
+        # Initialize the sync and async clients with pooled (HTTP/2 when available) transports
+        self.client = OpenAI(
+            api_key=self.api_key,
+            http_client=DefaultHttpxClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+        )
+        self.aclient = AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+        )
     
     def generate(self, prompt: str, stop: Optional[List[str]] = None) -> str:
         """Generate text using OpenAI API.
@@ -54,15 +137,256 @@ class OpenAIProvider(LLMProvider):
         Returns:
             Generated text response
         """
+        return self._generate_messages([{"role": "user", "content": prompt}], stop)
+    
+    def generate_with_system(
+        self,
+        system_prompt: str,
+        prompt: str,
+        stop: Optional[List[str]] = None
+    ) -> str:
+        """Generate text using OpenAI API with a separate system message.
+        
+        Args:
+            system_prompt: Static instructions sent as the system message
+            prompt: The per-request prompt sent as the user message
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            Generated text response
+        """
+        return self._generate_messages(self._system_messages(system_prompt, prompt), stop)
+    
+    async def agenerate(self, prompt: str, stop: Optional[List[str]] = None) -> str:
+        """Generate text asynchronously using OpenAI API.
+        
+        Args:
+            prompt: The prompt to send to the model
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            Generated text response
+        """
+        return await self._agenerate_messages([{"role": "user", "content": prompt}], stop)
+    
+    async def agenerate_with_system(
+        self,
+        system_prompt: str,
+        prompt: str,
+        stop: Optional[List[str]] = None
+    ) -> str:
+        """Generate text asynchronously using OpenAI API with a separate system message.
+        
+        Args:
+            system_prompt: Static instructions sent as the system message
+            prompt: The per-request prompt sent as the user message
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            Generated text response
+        """
+        return await self._agenerate_messages(self._system_messages(system_prompt, prompt), stop)
+    
+    @staticmethod
+    def _system_messages(system_prompt: str, prompt: str) -> List[Dict[str, str]]:
+        """Build a system + user message list.
+        
+        Args:
+            system_prompt: Static instructions sent as the system message
+            prompt: The per-request prompt sent as the user message
+            
+        Returns:
+            Chat messages for the completions API
+        """
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+    
+    def _generate_messages(self, messages: List[Dict[str, str]], stop: Optional[List[str]] = None) -> str:
+        """Generate text for a list of chat messages.
+        
+        Args:
+            messages: Chat messages to send to the model
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            Generated text response
+        """
+        cache_key = self._cache_key(messages, stop)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        if self.stream:
+            content = self._generate_streaming(messages, stop)
+        else:
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stop=stop
+            )
+            content = response.choices[0].message.content
+        
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+        return content
+    
+    async def _agenerate_messages(self, messages: List[Dict[str, str]], stop: Optional[List[str]] = None) -> str:
+        """Generate text asynchronously for a list of chat messages.
+        
+        Args:
+            messages: Chat messages to send to the model
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            Generated text response
+        """
+        cache_key = self._cache_key(messages, stop)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        if self.use_aiohttp:
+            content = await self._agenerate_with_aiohttp(messages, stop)
+        elif self.stream:
+            content = await self._agenerate_streaming(messages, stop)
+        else:
+            response = await self.aclient.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                stop=stop
+            )
+            content = response.choices[0].message.content
+        
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+        return content
+    
+    def _cache_key(self, messages: List[Dict[str, str]], stop: Optional[List[str]] = None) -> Optional[str]:
+        """Build the response cache key for a request.
+        
+        Args:
+            messages: Chat messages to send to the model
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            The cache key, or None if caching is disabled
+        """
+        if self.cache is None:
+            return None
+        return LLMResponseCache.make_key(messages, self.model, self.temperature, stop, self.max_tokens)
+    
+    def _generate_streaming(self, messages: List[Dict[str, str]], stop: Optional[List[str]] = None) -> str:
+        """Generate text from a streamed completion, stopping early on a stop sequence.
+        
+        Stop sequences are matched here rather than sent to the API, so the
+        stream is closed as soon as one arrives and any number can be used.
+        
+        Args:
+            messages: Chat messages to send to the model
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            Generated text response
+        """
+        detector = _StopDetector(stop)
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[{"role": "user", "content": prompt}],
+            messages=messages,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
-            stop=stop
+            stream=True
         )
+        try:
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if detector.feed(chunk.choices[0].delta.content):
+                        break
+        finally:
+            response.close()
+        
+        return detector.text
+    
+    async def _agenerate_streaming(self, messages: List[Dict[str, str]], stop: Optional[List[str]] = None) -> str:
+        """Asynchronously generate text from a streamed completion, stopping early on a stop sequence.
         
-        return response.choices[0].message.content
+        Args:
+            messages: Chat messages to send to the model
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            Generated text response
+        """
+        detector = _StopDetector(stop)
+        response = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True
+        )
+        try:
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    if detector.feed(chunk.choices[0].delta.content):
+                        break
+        finally:
+            await response.close()
+        
+        return detector.text
+    
+    async def _agenerate_with_aiohttp(self, messages: List[Dict[str, str]], stop: Optional[List[str]] = None) -> str:
+        """Generate text by posting directly to the chat completions endpoint.
+        
+        Args:
+            messages: Chat messages to send to the model
+            stop: Optional list of strings that will stop generation
+            
+        Returns:
+            Generated text response
+        """
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+        }
+        if self.max_tokens is not None:
+            payload["max_tokens"] = self.max_tokens
+        if stop:
+            payload["stop"] = stop
+        
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        session = self._aiohttp_sessions.get()
+        async with session.post(CHAT_COMPLETIONS_URL, json=payload, headers=headers) as response:
+            response.raise_for_status()
+            data = loads(await response.read())
+        
+        return data["choices"][0]["message"]["content"]
+    
+    async def aclose(self) -> None:
+        """Close this provider's aiohttp session used by `use_aiohttp=True`.
+        
+        The session is also closed automatically when the `asyncio.run` call
+        that created it finishes; call this when managing the event loop
+        yourself. Other providers are not affected, and a new session is
+        created on the next request.
+        """
+        await self._aiohttp_sessions.aclose()
+    
+    async def __aenter__(self) -> "OpenAIProvider":
+        """Enter an async context that closes the aiohttp session on exit."""
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Close the aiohttp session."""
+        await self.aclose()
     
     @property
     def provider_name(self) -> str:
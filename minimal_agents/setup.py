@@ -1,6 +1,19 @@
 """Setup configuration for minimal_agents package."""
 
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+
+try:
+    from Cython.Build import cythonize
+except ImportError:  # Optional: compile the response-parsing helpers
+    cythonize = None
+
+# Built only when Cython is installed; the pure-Python parser is used otherwise
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [Extension('minimal_agents.utils._parsing_c', ['utils/_parsing_c.pyx'], optional=True)],
+        language_level=3
+    )
 
 setup(
     name='minimal_agents',
@@ -10,8 +23,9 @@ setup(
     author_email='your.email@example.com',
     url='https://github.com/yourusername/minimal_agents',
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
-        'openai>=1.0.0',  # For OpenAI models
+        'openai>=1.17.0',  # For OpenAI models
         'pydantic>=2.0.0',  # For data validation
         'requests>=2.28.0',  # For API calls
         'python-dotenv>=1.0.0',  # For loading environment variables
@@ -20,6 +34,17 @@ setup(
         'google': [
             'google-genai',  # For Gemini models
         ],
+        'async': [
+            'aiohttp>=3.8.0',  # For the high-concurrency OpenAI fast path
+            'h2>=4.0.0',  # For HTTP/2 connections in the OpenAI client
+            'aioconsole>=0.6.0',  # For the async interactive example
+        ],
+        'fast': [
+            'orjson>=3.8.0',  # For faster JSON decoding of API responses
+            'pyahocorasick>=2.0.0',  # For single-pass response parsing
+            'hyperscan>=0.4.0',  # For SIMD token scanning (x86-64 only)
+            'cython>=3.0.0',  # For the compiled parsing helpers (install before building)
+        ],
         'development': [
             'pytest>=7.0.0',
             'black>=23.0.0',
@@ -27,6 +52,7 @@ setup(
         ],
         'tools': [
             'pandas>=2.0.0',  # For data operations
+            'numba>=0.57.0',  # For PythonREPL(jit=True)
             'beautifulsoup4>=4.11.0',  # For web scraping
         ]
     },
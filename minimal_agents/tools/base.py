@@ -1,5 +1,6 @@
 """Base tool interface for all tools in the MinimalAgents framework."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
@@ -28,6 +29,20 @@ class Tool(BaseModel, ABC):
         """
         pass
     
+    async def arun(self, input_text: str) -> str:
+        """Execute the tool asynchronously.
+        
+        Tools with a native async implementation should override this; the
+        default runs `run` in a worker thread.
+        
+        Args:
+            input_text: The text input to the tool
+            
+        Returns:
+            The tool's output as a string
+        """
+        return await asyncio.to_thread(self.run, input_text)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert the tool to a dictionary format for agent consumption.
         
@@ -1,11 +1,185 @@
 """Python REPL tool for executing Python code."""
 
+import contextlib
+import ctypes
+import re
+import signal
 import sys
+import threading
+import types
+from functools import lru_cache
 from io import StringIO
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, TextIO
+
+from pydantic import PrivateAttr
 
 from minimal_agents.tools.base import Tool
 
+# Optional leading ``` / ```python and trailing ``` Markdown fences
+_FENCE_RE = re.compile(r"\A(?:```(?:python)?)?(.*?)(?:```)?\Z", re.DOTALL)
+
+class _ThreadLocalStdout:
+    """Stand-in for sys.stdout that sends each capturing thread's writes to its own buffer.
+    
+    Threads that are not capturing write to the stream it replaced, so
+    concurrent REPL runs (e.g. via Tool.arun threads) neither wait for each
+    other nor capture each other's output.
+    """
+    
+    def __init__(self, stream: TextIO):
+        """Wrap the current sys.stdout.
+        
+        Args:
+            stream: Stream used by threads that are not capturing
+        """
+        self.stream = stream
+        self.local = threading.local()
+    
+    def _target(self) -> TextIO:
+        """Get the buffer of the calling thread, or the wrapped stream."""
+        return getattr(self.local, "buffer", None) or self.stream
+    
+    def write(self, text: str) -> int:
+        """Write to the calling thread's target."""
+        return self._target().write(text)
+    
+    def flush(self) -> None:
+        """Flush the calling thread's target."""
+        self._target().flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        """Delegate everything else (encoding, isatty, ...) to the current target."""
+        return getattr(self._target(), name)
+
+# Guards installing and removing the proxy; `_CAPTURE_COUNT` runs are capturing
+_PROXY_LOCK = threading.Lock()
+_CAPTURE_COUNT = 0
+
+@contextlib.contextmanager
+def _capture_stdout(buffer: StringIO):
+    """Send the current thread's writes to sys.stdout into `buffer`.
+    
+    sys.stdout is only replaced while at least one run is capturing.
+    
+    Args:
+        buffer: Buffer receiving this thread's output
+    """
+    global _CAPTURE_COUNT
+    with _PROXY_LOCK:
+        if not isinstance(sys.stdout, _ThreadLocalStdout):
+            sys.stdout = _ThreadLocalStdout(sys.stdout)
+        proxy = sys.stdout
+        _CAPTURE_COUNT += 1
+    
+    previous = getattr(proxy.local, "buffer", None)
+    proxy.local.buffer = buffer
+    try:
+        yield
+    finally:
+        proxy.local.buffer = previous
+        with _PROXY_LOCK:
+            _CAPTURE_COUNT -= 1
+            if _CAPTURE_COUNT == 0 and sys.stdout is proxy:
+                sys.stdout = proxy.stream
+
+class _ExecutionTimeout(BaseException):
+    """Raised inside executed code when it exceeds the time limit.
+    
+    Derives from BaseException so `except Exception` blocks in the executed
+    code cannot swallow it.
+    """
+
+def _set_async_exc(thread_id: int, exc_type: Optional[type]) -> None:
+    """Schedule `exc_type` to be raised in another thread, or clear it with None.
+    
+    Args:
+        thread_id: Identifier of the target thread
+        exc_type: Exception class to raise, or None to cancel a pending one
+    """
+    exc = ctypes.py_object(exc_type) if exc_type is not None else None
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), exc)
+
+@contextlib.contextmanager
+def _thread_time_limit(seconds: float):
+    """Interrupt the enclosed block in the current thread from a timer thread.
+    
+    Used where SIGALRM is unavailable, e.g. in the worker threads of
+    Tool.arun. The exception is delivered between bytecodes, so a single
+    long-running C call (such as time.sleep) finishes before it fires.
+    
+    Args:
+        seconds: Time limit in seconds
+    """
+    thread_id = threading.get_ident()
+    state_lock = threading.Lock()
+    state = {"done": False, "fired": False}
+    
+    def _interrupt():
+        with state_lock:
+            if not state["done"]:
+                _set_async_exc(thread_id, _ExecutionTimeout)
+                state["fired"] = True
+    
+    timer = threading.Timer(seconds, _interrupt)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    finally:
+        timer.cancel()
+        with state_lock:
+            state["done"] = True
+        if state["fired"]:
+            # Drop the exception if it has not been delivered yet
+            _set_async_exc(thread_id, None)
+
+@contextlib.contextmanager
+def _time_limit(seconds: Optional[float]):
+    """Interrupt the enclosed block with _ExecutionTimeout after `seconds`.
+    
+    Uses SIGALRM in the main thread on POSIX, unless the application already
+    has a real-time timer (e.g. signal.alarm) armed; a timer thread is used
+    everywhere else, so the application's timer is never disturbed.
+    
+    Args:
+        seconds: Time limit in seconds, or None for no limit
+    """
+    if not seconds:
+        yield
+        return
+    
+    if (
+        not hasattr(signal, "SIGALRM")
+        or threading.current_thread() is not threading.main_thread()
+        or signal.getitimer(signal.ITIMER_REAL)[0] > 0
+    ):
+        with _thread_time_limit(seconds):
+            yield
+        return
+    
+    def _raise_timeout(signum, frame):
+        raise _ExecutionTimeout()
+    
+    previous_handler = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+@lru_cache(maxsize=256)
+def _compile_code(code: str) -> types.CodeType:
+    """Compile REPL source, reusing the result for repeated snippets.
+    
+    Args:
+        code: Python source to compile
+        
+    Returns:
+        Compiled code object
+    """
+    return compile(code, "<python_repl>", "exec")
+
 class PythonREPL(Tool):
     """Tool for executing Python code in a REPL environment."""
     
@@ -18,16 +192,48 @@ class PythonREPL(Tool):
     )
     globals_dict: Dict = None
     locals_dict: Dict = None
+    jit: bool = False
+    timeout: Optional[float] = 30.0  # Seconds before execution is interrupted (None disables)
+    _module: Optional[types.ModuleType] = PrivateAttr(default=None)
+    # Runs share this REPL's namespace, so they take turns; separate REPLs run concurrently
+    _run_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     
     def __init__(self, **data):
         """Initialize the Python REPL tool.
         
         You can optionally provide globals_dict and locals_dict to maintain state
-        between executions.
+        between executions. By default code runs in the namespace of a private
+        module, with globals and locals unified so that functions defined in
+        one execution can see names defined in earlier ones.
+        
+        With jit=True, Numba's `njit` decorator is made available to executed
+        code for speeding up numeric loops. Compiled functions live in the REPL
+        namespace, so the compile cost is paid once per session. Numba's on-disk
+        cache cannot be used because REPL code has no source file.
         """
         super().__init__(**data)
-        self.globals_dict = self.globals_dict or globals().copy()
-        self.locals_dict = self.locals_dict or locals().copy()
+        if self.globals_dict is None:
+            # An empty module, so executed code cannot reach this module's internals
+            self._module = types.ModuleType("_python_repl")
+            self.globals_dict = self._module.__dict__
+        self.locals_dict = self.locals_dict or self.globals_dict
+        
+        if self.jit:
+            self._enable_jit()
+    
+    def _enable_jit(self) -> None:
+        """Expose Numba's `njit` decorator to executed code and advertise it to the LLM."""
+        try:
+            from numba import njit
+        except ImportError:
+            raise ImportError("numba is required for jit=True. Install it with `pip install numba`.")
+        
+        self.globals_dict["njit"] = njit
+        self.description += (
+            " For heavy numeric loops you can decorate functions with @njit "
+            "(already imported); it only supports numbers, NumPy arrays and simple "
+            "containers, not regex or general Python objects."
+        )
     
     def run(self, input_text: str) -> str:
         """Execute Python code and return the output.
@@ -42,32 +248,23 @@ class PythonREPL(Tool):
         code = input_text.strip()
         
         # Remove Markdown code fences if present
-        if code.startswith("```python"):
-            code = code[9:]
-        elif code.startswith("```"):
-            code = code[3:]
-            
-        if code.endswith("```"):
-            code = code[:-3]
+        code = _FENCE_RE.match(code).group(1)
         
         # Redirect stdout to capture output
-        old_stdout = sys.stdout
-        sys.stdout = mystdout = StringIO()
+        buffer = StringIO()
         
         try:
             # Execute the code
-            exec(code, self.globals_dict, self.locals_dict)
-            sys.stdout = old_stdout
-            output = mystdout.getvalue()
-            
-            # Return output if any, or success message
-            if output.strip():
-                return output
-            else:
-                return "Code executed successfully (no output)."
+            with self._run_lock, _capture_stdout(buffer), _time_limit(self.timeout):
+                exec(_compile_code(code), self.globals_dict, self.locals_dict)
+        except _ExecutionTimeout:
+            return f"Error: timeout after {self.timeout}s"
         except Exception as e:
-            sys.stdout = old_stdout
             return f"Error: {str(e)}"
-        finally:
-            # Ensure stdout is restored even if there's an error
-            sys.stdout = old_stdout
\ No newline at end of file
+        
+        # Return output if any, or success message
+        output = buffer.getvalue()
+        if output.strip():
+            return output
+        else:
+            return "Code executed successfully (no output)."
\ No newline at end of file
@@ -1,10 +1,54 @@
 """Web search tool implementation."""
 
+import asyncio
 import os
 import requests
-from typing import Dict, Optional, List
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Optional, List, Tuple
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency for async searches
+    aiohttp = None
 
 from minimal_agents.tools.base import Tool
+from minimal_agents.utils.aiohttp_session import LoopBoundSession
+from minimal_agents.utils.serialization import loads
+
+def _create_session() -> requests.Session:
+    """Create a pooled HTTP session shared by all search requests.
+    
+    Reusing connections avoids a TCP + TLS handshake per query. urllib3
+    already sets TCP_NODELAY on its sockets.
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    session.mount("https://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive"
+    })
+    return session
+
+_SESSION = _create_session()
+
+# Shared aiohttp session for single async searches, one per event loop
+_AIOHTTP_SESSIONS = LoopBoundSession(limit=32, limit_per_host=8)
+
+# Search engine name -> (request builder, result parser) method names
+_ENGINES = {
+    "serp": ("_serp_request", "_parse_serp_results"),
+    "google": ("_google_request", "_parse_google_results"),
+    "bing": ("_bing_request", "_parse_bing_results"),
+}
 
 class WebSearch(Tool):
     """Tool for searching the web for information."""
@@ -52,22 +96,97 @@ class WebSearch(Tool):
         """
         query = input_text.strip()
         
+        if self.search_engine not in _ENGINES:
+            return f"Error: Unsupported search engine '{self.search_engine}'"
+        
+        try:
+            results = self._search(query)
+            return self._format_results(query, results)
+        except Exception as e:
+            return f"Search error: {str(e)}"
+    
+    async def arun(self, input_text: str) -> str:
+        """Run a web search asynchronously with the given query.
+        
+        Uses aiohttp when it is installed, otherwise falls back to running
+        the blocking search in a worker thread.
+        
+        Args:
+            input_text: Search query or question
+            
+        Returns:
+            Search results as formatted string
+        """
+        if aiohttp is None:
+            return await super().arun(input_text)
+        
+        return await self._arun_with_session(input_text, _AIOHTTP_SESSIONS.get())
+    
+    async def _arun_with_session(self, input_text: str, session: Any) -> str:
+        """Run a web search asynchronously using the given aiohttp session.
+        
+        Args:
+            input_text: Search query or question
+            session: aiohttp.ClientSession to send the request with
+            
+        Returns:
+            Search results as formatted string
+        """
+        query = input_text.strip()
+        
+        if self.search_engine not in _ENGINES:
+            return f"Error: Unsupported search engine '{self.search_engine}'"
+        
         try:
-            if self.search_engine == "serp":
-                results = self._search_with_serp(query)
-            elif self.search_engine == "google":
-                results = self._search_with_google(query)
-            elif self.search_engine == "bing":
-                results = self._search_with_bing(query)
-            else:
-                return f"Error: Unsupported search engine '{self.search_engine}'"
-                
+            results = await self._asearch(query, session)
             return self._format_results(query, results)
         except Exception as e:
             return f"Search error: {str(e)}"
     
-    def _search_with_serp(self, query: str) -> List[Dict]:
-        """Perform search with SerpAPI.
+    async def arun_batch(self, queries: List[str], max_concurrency: int = 8) -> List[str]:
+        """Run several web searches concurrently.
+        
+        With aiohttp installed, the batch shares one session that is closed
+        when the batch finishes.
+        
+        Args:
+            queries: Search queries or questions
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Search results as formatted strings, in the same order as `queries`
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        if aiohttp is None:
+            async def run_one(query: str) -> str:
+                async with semaphore:
+                    return await self.arun(query)
+            
+            return await asyncio.gather(*(run_one(query) for query in queries))
+        
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=8)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def run_one_with_session(query: str) -> str:
+                async with semaphore:
+                    return await self._arun_with_session(query, session)
+            
+            return await asyncio.gather(*(run_one_with_session(query) for query in queries))
+    
+    def run_batch(self, queries: List[str], max_concurrency: int = 8) -> List[str]:
+        """Run several web searches concurrently from synchronous code.
+        
+        Args:
+            queries: Search queries or questions
+            max_concurrency: Maximum number of requests in flight at once
+            
+        Returns:
+            Search results as formatted strings, in the same order as `queries`
+        """
+        return asyncio.run(self.arun_batch(queries, max_concurrency))
+    
+    def _search(self, query: str) -> List[Dict]:
+        """Perform a search with the configured search engine.
         
         Args:
             query: Search query
@@ -75,6 +194,49 @@ class WebSearch(Tool):
         Returns:
             List of result dictionaries
         """
+        build_request, parse_results = self._engine_methods()
+        url, params, headers = build_request(query)
+        
+        response = _SESSION.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        return parse_results(loads(response.content))
+    
+    async def _asearch(self, query: str, session: Any) -> List[Dict]:
+        """Perform a search with the configured search engine using aiohttp.
+        
+        Args:
+            query: Search query
+            session: aiohttp.ClientSession to send the request with
+            
+        Returns:
+            List of result dictionaries
+        """
+        build_request, parse_results = self._engine_methods()
+        url, params, headers = build_request(query)
+        
+        async with session.get(url, headers=headers, params=params) as response:
+            response.raise_for_status()
+            data = loads(await response.read())
+        return parse_results(data)
+    
+    def _engine_methods(self) -> Tuple[Any, Any]:
+        """Get the request builder and result parser for the configured engine.
+        
+        Returns:
+            Tuple of (request builder, result parser) bound methods
+        """
+        build_name, parse_name = _ENGINES[self.search_engine]
+        return getattr(self, build_name), getattr(self, parse_name)
+    
+    def _serp_request(self, query: str) -> Tuple[str, Dict, Dict]:
+        """Build a SerpAPI search request.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Tuple of (url, params, headers)
+        """
         url = "https://serpapi.com/search"
         params = {
             "q": query,
@@ -82,11 +244,17 @@ class WebSearch(Tool):
             "engine": "google",
             "num": self.max_results
         }
+        return url, params, {}
+    
+    def _parse_serp_results(self, data: Dict) -> List[Dict]:
+        """Parse a SerpAPI response.
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
+        Args:
+            data: Decoded JSON response
+            
+        Returns:
+            List of result dictionaries
+        """
         results = []
         if "organic_results" in data:
             for result in data["organic_results"][:self.max_results]:
@@ -98,14 +266,14 @@ class WebSearch(Tool):
         
         return results
     
-    def _search_with_google(self, query: str) -> List[Dict]:
-        """Perform search with Google Custom Search API.
+    def _google_request(self, query: str) -> Tuple[str, Dict, Dict]:
+        """Build a Google Custom Search API request.
         
         Args:
             query: Search query
             
         Returns:
-            List of result dictionaries
+            Tuple of (url, params, headers)
         """
         # Requires additional environment variables:
         # - GOOGLE_CSE_ID (Custom Search Engine ID)
@@ -120,11 +288,17 @@ class WebSearch(Tool):
             "cx": cse_id,
             "num": self.max_results
         }
+        return url, params, {}
+    
+    def _parse_google_results(self, data: Dict) -> List[Dict]:
+        """Parse a Google Custom Search API response.
         
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
+        Args:
+            data: Decoded JSON response
+            
+        Returns:
+            List of result dictionaries
+        """
         results = []
         if "items" in data:
             for item in data["items"][:self.max_results]:
@@ -136,14 +310,14 @@ class WebSearch(Tool):
         
         return results
     
-    def _search_with_bing(self, query: str) -> List[Dict]:
-        """Perform search with Bing Search API.
+    def _bing_request(self, query: str) -> Tuple[str, Dict, Dict]:
+        """Build a Bing Search API request.
         
         Args:
             query: Search query
             
         Returns:
-            List of result dictionaries
+            Tuple of (url, params, headers)
         """
         url = "https://api.bing.microsoft.com/v7.0/search"
         headers = {"Ocp-Apim-Subscription-Key": self.api_key}
@@ -152,11 +326,17 @@ class WebSearch(Tool):
             "count": self.max_results,
             "responseFilter": "Webpages"
         }
+        return url, params, headers
+    
+    def _parse_bing_results(self, data: Dict) -> List[Dict]:
+        """Parse a Bing Search API response.
         
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        
+        Args:
+            data: Decoded JSON response
+            
+        Returns:
+            List of result dictionaries
+        """
         results = []
         if "webPages" in data and "value" in data["webPages"]:
             for item in data["webPages"]["value"][:self.max_results]:
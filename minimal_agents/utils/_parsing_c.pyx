@@ -0,0 +1,86 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled versions of the hot helpers in minimal_agents.utils.parsing.
+
+Built by setup.py when Cython is installed; parsing.py falls back to its
+pure-Python implementations otherwise, so behaviour must stay identical.
+"""
+
+from bisect import bisect_left
+
+cdef str OBSERVATION_TOKEN = "Observation:"
+cdef str TOOL_INPUT_STRIP = " \n\"'"
+cdef Py_ssize_t ACTION_INPUT_TOKEN_LEN = len("Action Input:")
+
+cpdef tuple slice_tool_call(str text, Py_ssize_t name_start, Py_ssize_t input_idx):
+    """Slice the tool name and input out of a located tool call."""
+    cdef Py_ssize_t text_len = len(text)
+    cdef Py_ssize_t input_start = input_idx + ACTION_INPUT_TOKEN_LEN
+    cdef Py_ssize_t input_end
+    cdef str tool_name = text[name_start:input_idx]
+
+    # Drop one optional leading "[" and one optional "]" before trailing newlines
+    if tool_name.startswith("["):
+        tool_name = tool_name[1:]
+    tool_name = tool_name.rstrip("\n")
+    if tool_name.endswith("]"):
+        tool_name = tool_name[:-1]
+
+    while input_start < text_len and text[input_start].isspace():
+        input_start += 1
+    input_end = find_observation_boundary(text, input_start)
+
+    return tool_name.strip(), text[input_start:input_end].strip(TOOL_INPUT_STRIP)
+
+cpdef Py_ssize_t find_observation_boundary(str text, Py_ssize_t start):
+    """Find the newline that starts a `\\n\\s*Observation:` run, or len(text)."""
+    cdef Py_ssize_t obs_idx = text.find(OBSERVATION_TOKEN, start)
+    cdef Py_ssize_t run_start, newline_idx
+    while obs_idx != -1:
+        run_start = obs_idx
+        while run_start > start and text[run_start - 1].isspace():
+            run_start -= 1
+        newline_idx = text.find("\n", run_start, obs_idx)
+        if newline_idx != -1:
+            return newline_idx
+        obs_idx = text.find(OBSERVATION_TOKEN, obs_idx + 1)
+    return len(text)
+
+def iter_sections(str text, str token, Py_ssize_t token_len, tuple delimiters):
+    """Yield the stripped text following each occurrence of a token."""
+    cdef Py_ssize_t text_len = len(text)
+    cdef Py_ssize_t pos = text.find(token)
+    cdef Py_ssize_t body_start, end, idx
+    cdef str delimiter
+    while pos != -1:
+        body_start = pos + token_len
+        end = text_len
+        for delimiter in delimiters:
+            idx = text.find(delimiter, body_start, end)
+            if idx != -1:
+                end = idx
+        yield text[body_start:end].strip()
+        pos = text.find(token, end)
+
+cpdef tuple sections_from_positions(
+    str text,
+    list starts,
+    Py_ssize_t token_len,
+    list delimiter_starts
+):
+    """Slice sections like `iter_sections`, using precomputed token positions."""
+    cdef list sections = []
+    cdef list delimiter
+    cdef Py_ssize_t text_len = len(text)
+    cdef Py_ssize_t n_starts = len(starts)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t j, body_start, end
+    while i < n_starts:
+        body_start = <Py_ssize_t>starts[i] + token_len
+        end = text_len
+        for delimiter in delimiter_starts:
+            j = bisect_left(delimiter, body_start)
+            if j < len(delimiter) and <Py_ssize_t>delimiter[j] < end:
+                end = delimiter[j]
+        sections.append(text[body_start:end].strip())
+        i = bisect_left(starts, end, i + 1)
+    return tuple(sections)
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Shared aiohttp sessions tied to the lifetime of an event loop."""
+
+import asyncio
+from typing import Any, Optional
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency for the aiohttp fast paths
+    aiohttp = None
+
+async def _close_on_cancel(session: Any) -> None:
+    """Wait until cancelled, then close the session.
+    
+    `asyncio.run` cancels leftover tasks before it closes its loop, so this
+    releases the session's connections on the loop that owns them.
+    
+    Args:
+        session: The aiohttp.ClientSession to close
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await session.close()
+
+class LoopBoundSession:
+    """A pooled aiohttp session reused for every call within one event loop.
+    
+    A new session is created when the running loop changes. Each session is
+    closed automatically when the `asyncio.run` call that created it
+    finishes, or explicitly with `aclose()`.
+    """
+    
+    def __init__(self, limit: int, limit_per_host: int):
+        """Initialize the holder; no session is created until first use.
+        
+        Args:
+            limit: Maximum number of open connections
+            limit_per_host: Maximum number of open connections per host
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session: Optional[Any] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closer: Optional[asyncio.Task] = None
+    
+    def get(self) -> Any:
+        """Get the session for the running loop, creating it if needed.
+        
+        Returns:
+            An open aiohttp.ClientSession bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and not self._session.closed and self._loop is loop:
+            return self._session
+        
+        connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+        self._session = aiohttp.ClientSession(connector=connector)
+        self._loop = loop
+        self._closer = loop.create_task(_close_on_cancel(self._session))
+        return self._session
+    
+    async def aclose(self) -> None:
+        """Close the current session if it belongs to the running loop."""
+        if self._session is None or self._loop is not asyncio.get_running_loop():
+            return
+        session, closer = self._session, self._closer
+        self._session = self._loop = self._closer = None
+        closer.cancel()
+        await session.close()
\ No newline at end of file
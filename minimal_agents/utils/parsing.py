@@ -1,17 +1,322 @@
 """Utility functions for parsing LLM responses."""
 
-import re
-from typing import Tuple, Optional
-
-# Token constants used for parsing
-FINAL_ANSWER_TOKEN = "Final Answer:"
-OBSERVATION_TOKEN = "Observation:"
-THOUGHT_TOKEN = "Thought:"
-PLAN_TOKEN = "Plan:"
-ACTION_TOKEN = "Action:"
-ACTION_INPUT_TOKEN = "Action Input:"
-CHAT_RESPONSE_TOKEN = "Chat Response:"
+import sys
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency for single-pass token scanning
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:  # Optional dependency for SIMD token scanning
+    hyperscan = None
+
+# Token constants used for parsing, interned so identity checks short-circuit
+# equality and dict lookups (other modules import these rather than redefining them)
+FINAL_ANSWER_TOKEN = sys.intern("Final Answer:")
+OBSERVATION_TOKEN = sys.intern("Observation:")
+THOUGHT_TOKEN = sys.intern("Thought:")
+PLAN_TOKEN = sys.intern("Plan:")
+ACTION_TOKEN = sys.intern("Action:")
+ACTION_INPUT_TOKEN = sys.intern("Action Input:")
+CHAT_RESPONSE_TOKEN = sys.intern("Chat Response:")
+
+_TOKENS = (
+    FINAL_ANSWER_TOKEN,
+    OBSERVATION_TOKEN,
+    THOUGHT_TOKEN,
+    PLAN_TOKEN,
+    ACTION_TOKEN,
+    ACTION_INPUT_TOKEN,
+    CHAT_RESPONSE_TOKEN
+)
+
+# Tool calls start with the action token followed by a single space
+_ACTION_PREFIX = ACTION_TOKEN + " "
+
+# Characters trimmed from both ends of a tool input
+TOOL_INPUT_STRIP = " \n\"'"
+
+# Token lengths used when slicing past a match
+_ACTION_PREFIX_LEN = len(_ACTION_PREFIX)
+_ACTION_TOKEN_LEN = len(ACTION_TOKEN)
+_ACTION_INPUT_TOKEN_LEN = len(ACTION_INPUT_TOKEN)
+_OBS_TOKEN_LEN = len(OBSERVATION_TOKEN)
+_THOUGHT_TOKEN_LEN = len(THOUGHT_TOKEN)
+
+# Section delimiters: an observation runs until the next thought, a thought
+# until the next action, plan or final answer
+_OBS_DELIMITERS = (THOUGHT_TOKEN,)
+_THOUGHT_DELIMITERS = (ACTION_TOKEN, PLAN_TOKEN, FINAL_ANSWER_TOKEN)
+
+def _build_automaton() -> Optional["ahocorasick.Automaton"]:
+    """Build an Aho-Corasick automaton over all parsing tokens.
+    
+    Returns:
+        The automaton, or None if pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for token in _TOKENS:
+        automaton.add_word(token, (token, len(token) - 1))
+    automaton.make_automaton()
+    return automaton
+
+_AUTOMATON = _build_automaton()
+
+def _build_hyperscan_database() -> Optional["hyperscan.Database"]:
+    """Compile all parsing tokens into a Hyperscan block-mode database.
+    
+    Returns:
+        The database, or None if the hyperscan bindings are not installed
+    """
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[token.encode("ascii") for token in _TOKENS],
+        ids=list(range(len(_TOKENS))),
+        elements=len(_TOKENS),
+        flags=hyperscan.HS_FLAG_SOM_LEFTMOST
+    )
+    return database
+
+_HYPERSCAN_DB = _build_hyperscan_database()
+
+# Hyperscan scratch space must not be shared between concurrent scans
+_HYPERSCAN_LOCAL = threading.local()
+
+def _hyperscan_scratch() -> "hyperscan.Scratch":
+    """Get this thread's Hyperscan scratch space, allocating it on first use."""
+    scratch = getattr(_HYPERSCAN_LOCAL, "scratch", None)
+    if scratch is None:
+        scratch = _HYPERSCAN_LOCAL.scratch = hyperscan.Scratch(_HYPERSCAN_DB)
+    return scratch
+
+# Number of distinct responses each parser memoizes
+_PARSE_CACHE_SIZE = 256
+
+@dataclass(frozen=True)
+class ParsedResponse:
+    """Everything the `extract_*` helpers find in one LLM response.
+    
+    Instances are immutable because `parse_response` results are cached.
+    
+    Attributes:
+        final_answer: As returned by `extract_final_answer`
+        chat_response: As returned by `extract_chat_response`
+        tool_name: Tool name from `extract_tool_calls`
+        tool_input: Tool input from `extract_tool_calls`
+        observations: As returned by `extract_observations`, as a tuple
+        thoughts: As returned by `extract_thoughts`, as a tuple
+        tool_index: Position of `tool_name` in the tool set of a parser made
+            by `build_parser`, or None if the tool is unknown or not checked
+    """
+    
+    final_answer: Optional[str] = None
+    chat_response: Optional[str] = None
+    tool_name: Optional[str] = None
+    tool_input: Optional[str] = None
+    observations: Tuple[str, ...] = ()
+    thoughts: Tuple[str, ...] = ()
+    tool_index: Optional[int] = None
+    
+    @property
+    def tool_call(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get the (tool_name, tool_input) pair."""
+        return self.tool_name, self.tool_input
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def parse_response(text: str) -> ParsedResponse:
+    """Parse every section of an LLM response from a single token scan.
+    
+    Equivalent to calling each `extract_*` function, but the text is
+    scanned for tokens once (see `scan_tokens`) and every section is
+    sliced from the token positions.
+    
+    Args:
+        text: The raw LLM response text
+        
+    Returns:
+        ParsedResponse with all extracted sections
+    """
+    positions = _scan_tokens(text)
+    tool_name, tool_input = None, None
+    
+    # First "Action: " (with the space), then the first "Action Input:" after it
+    for action_idx in positions[ACTION_TOKEN]:
+        if text.startswith(" ", action_idx + _ACTION_TOKEN_LEN):
+            name_start = action_idx + _ACTION_PREFIX_LEN
+            input_starts = positions[ACTION_INPUT_TOKEN]
+            i = bisect_left(input_starts, name_start)
+            if i < len(input_starts):
+                tool_name, tool_input = _slice_tool_call(text, name_start, input_starts[i])
+            break
+    
+    return ParsedResponse(
+        final_answer=_first_segment(text, positions[FINAL_ANSWER_TOKEN], len(FINAL_ANSWER_TOKEN)),
+        chat_response=_first_segment(text, positions[CHAT_RESPONSE_TOKEN], len(CHAT_RESPONSE_TOKEN)),
+        observations=_sections_from_positions(
+            text, positions[OBSERVATION_TOKEN], _OBS_TOKEN_LEN,
+            [positions[token] for token in _OBS_DELIMITERS]
+        ),
+        thoughts=_sections_from_positions(
+            text, positions[THOUGHT_TOKEN], _THOUGHT_TOKEN_LEN,
+            [positions[token] for token in _THOUGHT_DELIMITERS]
+        ),
+        tool_name=tool_name,
+        tool_input=tool_input
+    )
+
+def scan_tokens(text: str) -> List[Tuple[str, int, int]]:
+    """Find every parsing token in a text.
+    
+    Uses Hyperscan when it is installed, then pyahocorasick, then `str.find`.
+    
+    Args:
+        text: The raw LLM response text
+        
+    Returns:
+        List of (token, start, end) tuples, ordered by start index
+    """
+    events = [
+        (token, start, start + len(token))
+        for token, starts in _scan_tokens(text).items()
+        for start in starts
+    ]
+    events.sort(key=lambda event: event[1])
+    return events
+
+@lru_cache(maxsize=32)
+def build_parser(tool_names: Tuple[str, ...]) -> Callable[[str], ParsedResponse]:
+    """Generate a `parse_response` variant specialized to a fixed tool set.
+    
+    The generated function checks the parsed tool name with a branch on its
+    length followed by comparisons against the tool names as literals, and
+    records the match in `ParsedResponse.tool_index`. A repeated name maps
+    to its last position, like a dict built from the list. Results are
+    cached like those of `parse_response`.
+    
+    Args:
+        tool_names: Names of the available tools, in order
+        
+    Returns:
+        Function taking the response text and returning a ParsedResponse
+    """
+    by_length: Dict[int, Dict[str, int]] = {}
+    for index, name in enumerate(tool_names):
+        by_length.setdefault(len(name), {})[name] = index
+    
+    lines = [
+        "def parse_for_toolset(text):",
+        "    parsed = parse_response(text)",
+        "    name = parsed.tool_name",
+        "    if name is None:",
+        "        return parsed",
+        "    size = len(name)",
+    ]
+    keyword = "if"
+    for length, names in by_length.items():
+        lines.append(f"    {keyword} size == {length}:")
+        for name, index in names.items():
+            lines.append(f"        if name == {name!r}:")
+            lines.append(f"            return replace(parsed, tool_index={index})")
+        keyword = "elif"
+    lines.append("    return parsed")
+    
+    namespace = {"parse_response": parse_response, "replace": replace}
+    exec(compile("\n".join(lines), "<minimal_agents.parsing.build_parser>", "exec"), namespace)
+    return lru_cache(maxsize=_PARSE_CACHE_SIZE)(namespace["parse_for_toolset"])
+
+def _scan_tokens(text: str) -> Dict[str, List[int]]:
+    """Find the start index of every token occurrence.
+    
+    Args:
+        text: The raw LLM response text
+        
+    Returns:
+        Mapping of token to its sorted start indices
+    """
+    positions = {token: [] for token in _TOKENS}
+    
+    # Hyperscan reports byte offsets, which equal str indices only for ASCII text
+    if _HYPERSCAN_DB is not None and text.isascii():
+        def on_match(token_id: int, start: int, end: int, flags: int, context: None) -> None:
+            positions[_TOKENS[token_id]].append(start)
+        
+        _HYPERSCAN_DB.scan(
+            text.encode("ascii"), match_event_handler=on_match, scratch=_hyperscan_scratch()
+        )
+        return positions
+    
+    if _AUTOMATON is not None:
+        for end, (token, offset) in _AUTOMATON.iter(text):
+            positions[token].append(end - offset)
+        return positions
+    
+    for token in _TOKENS:
+        starts = positions[token]
+        idx = text.find(token)
+        while idx != -1:
+            starts.append(idx)
+            idx = text.find(token, idx + 1)
+    return positions
+
+def _first_segment(text: str, starts: List[int], token_len: int) -> Optional[str]:
+    """Slice the text between the first two occurrences of a token.
+    
+    Args:
+        text: The raw LLM response text
+        starts: Sorted start indices of the token
+        token_len: Length of the token
+        
+    Returns:
+        The stripped segment, or None if the token does not occur
+    """
+    if not starts:
+        return None
+    end = starts[1] if len(starts) > 1 else len(text)
+    return text[starts[0] + token_len:end].strip()
+
+def _sections_from_positions(
+    text: str,
+    starts: List[int],
+    token_len: int,
+    delimiter_starts: List[List[int]]
+) -> Tuple[str, ...]:
+    """Slice sections like `_iter_sections`, using precomputed token positions.
+    
+    Args:
+        text: The combined LLM response text
+        starts: Sorted start indices of the opening token
+        token_len: Length of the opening token
+        delimiter_starts: Sorted start indices of each closing token
+        
+    Returns:
+        Tuple of stripped section strings
+    """
+    sections = []
+    text_len = len(text)
+    i = 0
+    while i < len(starts):
+        body_start = starts[i] + token_len
+        end = text_len
+        for delimiter in delimiter_starts:
+            j = bisect_left(delimiter, body_start)
+            if j < len(delimiter) and delimiter[j] < end:
+                end = delimiter[j]
+        sections.append(text[body_start:end].strip())
+        i = bisect_left(starts, end, i + 1)
+    return tuple(sections)
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def extract_tool_calls(text: str) -> Tuple[Optional[str], Optional[str]]:
     """Extract tool name and input from LLM response.
     
@@ -21,17 +326,71 @@ def extract_tool_calls(text: str) -> Tuple[Optional[str], Optional[str]]:
     Returns:
         Tuple of (tool_name, tool_input) or (None, None) if not found
     """
-    # Regular expression to extract action and action input
-    action_regex = r"Action: [\[]?(.*?)[\]]?[\n]*Action Input:[\s]*(.*?)(?=\n\s*Observation:|\Z)"
-    match = re.search(action_regex, text, re.DOTALL)
+    # Same semantics as _ACTION_RE, located with str.find instead of the regex engine
+    action_idx = text.find(_ACTION_PREFIX)
+    if action_idx == -1:
+        return None, None
     
-    if not match:
+    name_start = action_idx + _ACTION_PREFIX_LEN
+    input_idx = text.find(ACTION_INPUT_TOKEN, name_start)
+    if input_idx == -1:
         return None, None
+    return _slice_tool_call(text, name_start, input_idx)
+
+def _slice_tool_call(text: str, name_start: int, input_idx: int) -> Tuple[str, str]:
+    """Slice the tool name and input out of a located tool call.
+    
+    Args:
+        text: The raw LLM response text
+        name_start: Index just past the "Action: " prefix
+        input_idx: Index of the "Action Input:" token
         
-    tool_name = match.group(1).strip()
-    tool_input = match.group(2).strip(" \n\"'")
+    Returns:
+        Tuple of (tool_name, tool_input)
+    """
+    # Drop one optional leading "[" and one optional "]" before trailing newlines
+    tool_name = text[name_start:input_idx]
+    if tool_name.startswith("["):
+        tool_name = tool_name[1:]
+    tool_name = tool_name.rstrip("\n")
+    if tool_name.endswith("]"):
+        tool_name = tool_name[:-1]
+    
+    text_len = len(text)
+    input_start = input_idx + _ACTION_INPUT_TOKEN_LEN
+    while input_start < text_len and text[input_start].isspace():
+        input_start += 1
+    input_end = _find_observation_boundary(text, input_start)
+    
+    tool_name = tool_name.strip()
+    tool_input = text[input_start:input_end].strip(TOOL_INPUT_STRIP)
     return tool_name, tool_input
 
+def _find_observation_boundary(text: str, start: int) -> int:
+    """Find where a tool input ends.
+    
+    That is the first newline followed by optional whitespace and an
+    observation token, mirroring the regex lookahead `\\n\\s*Observation:`.
+    
+    Args:
+        text: The raw LLM response text
+        start: Index where the tool input begins
+        
+    Returns:
+        Index of the boundary newline, or len(text) if there is none
+    """
+    obs_idx = text.find(OBSERVATION_TOKEN, start)
+    while obs_idx != -1:
+        run_start = obs_idx
+        while run_start > start and text[run_start - 1].isspace():
+            run_start -= 1
+        newline_idx = text.find("\n", run_start, obs_idx)
+        if newline_idx != -1:
+            return newline_idx
+        obs_idx = text.find(OBSERVATION_TOKEN, obs_idx + 1)
+    return len(text)
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def extract_final_answer(text: str) -> Optional[str]:
     """Extract final answer from LLM response.
     
@@ -41,12 +400,15 @@ def extract_final_answer(text: str) -> Optional[str]:
     Returns:
         The extracted final answer or None if not found
     """
-    if FINAL_ANSWER_TOKEN not in text:
+    _, sep, tail = text.partition(FINAL_ANSWER_TOKEN)
+    if not sep:
         return None
-        
-    final_answer = text.split(FINAL_ANSWER_TOKEN)[1].strip()
+    
+    # Stop at a repeated token, matching text.split(FINAL_ANSWER_TOKEN)[1]
+    final_answer = tail.partition(FINAL_ANSWER_TOKEN)[0].strip()
     return final_answer
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def extract_chat_response(text: str) -> Optional[str]:
     """Extract direct chat response from LLM response.
     
@@ -56,12 +418,74 @@ def extract_chat_response(text: str) -> Optional[str]:
     Returns:
         The extracted chat response or None if not found
     """
-    if CHAT_RESPONSE_TOKEN not in text:
+    _, sep, tail = text.partition(CHAT_RESPONSE_TOKEN)
+    if not sep:
         return None
-        
-    chat_response = text.split(CHAT_RESPONSE_TOKEN)[1].strip()
+    
+    # Stop at a repeated token, matching text.split(CHAT_RESPONSE_TOKEN)[1]
+    chat_response = tail.partition(CHAT_RESPONSE_TOKEN)[0].strip()
     return chat_response
 
+def _iter_sections(
+    text: str,
+    token: str,
+    token_len: int,
+    delimiters: Tuple[str, ...]
+) -> Iterator[str]:
+    """Yield the stripped text following each occurrence of a token.
+    
+    A section runs from the end of `token` to the nearest delimiter (or the
+    end of the text), and the next search resumes at that delimiter, so
+    sections never overlap. Only `str.find` is used, keeping the scan linear
+    in the length of the text.
+    
+    Args:
+        text: The combined LLM response text
+        token: Token that opens a section
+        token_len: Precomputed `len(token)`
+        delimiters: Tokens that close a section
+        
+    Yields:
+        Stripped section strings, in order of appearance
+    """
+    text_len = len(text)
+    pos = text.find(token)
+    while pos != -1:
+        body_start = pos + token_len
+        end = text_len
+        for delimiter in delimiters:
+            idx = text.find(delimiter, body_start, end)
+            if idx != -1:
+                end = idx
+        yield text[body_start:end].strip()
+        pos = text.find(token, end)
+
+def iter_observations(text: str) -> Iterator[str]:
+    """Lazily yield the observations in a response.
+    
+    Unlike `extract_observations`, the text is only scanned as far as the
+    caller iterates, so taking the first observation stops at the first
+    section.
+    
+    Args:
+        text: The combined LLM response text
+        
+    Yields:
+        Observation strings, in order of appearance
+    """
+    return _iter_sections(text, OBSERVATION_TOKEN, _OBS_TOKEN_LEN, _OBS_DELIMITERS)
+
+def iter_thoughts(text: str) -> Iterator[str]:
+    """Lazily yield the thought sections in a response.
+    
+    Args:
+        text: The combined LLM response text
+        
+    Yields:
+        Thought strings, in order of appearance
+    """
+    return _iter_sections(text, THOUGHT_TOKEN, _THOUGHT_TOKEN_LEN, _THOUGHT_DELIMITERS)
+
 def extract_observations(text: str) -> list[str]:
     """Extract all observations from a response with multiple tool calls.
     
@@ -71,9 +495,7 @@ def extract_observations(text: str) -> list[str]:
     Returns:
         List of observation strings
     """
-    observation_pattern = f"{OBSERVATION_TOKEN}(.*?)(?={THOUGHT_TOKEN}|$)"
-    observations = re.findall(observation_pattern, text, re.DOTALL)
-    return [obs.strip() for obs in observations]
+    return list(_extract_observations_cached(text))
 
 def extract_thoughts(text: str) -> list[str]:
     """Extract all thought sections from a response.
@@ -84,6 +506,25 @@ def extract_thoughts(text: str) -> list[str]:
     Returns:
         List of thought strings
     """
-    thought_pattern = f"{THOUGHT_TOKEN}(.*?)(?={ACTION_TOKEN}|{PLAN_TOKEN}|{FINAL_ANSWER_TOKEN}|$)"
-    thoughts = re.findall(thought_pattern, text, re.DOTALL)
-    return [thought.strip() for thought in thoughts]
\ No newline at end of file
+    return list(_extract_thoughts_cached(text))
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _extract_observations_cached(text: str) -> Tuple[str, ...]:
+    """Memoized observation extraction; a tuple so cached results cannot be mutated."""
+    return tuple(iter_observations(text))
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _extract_thoughts_cached(text: str) -> Tuple[str, ...]:
+    """Memoized thought extraction; a tuple so cached results cannot be mutated."""
+    return tuple(iter_thoughts(text))
+
+# Prefer the Cython build of the hot helpers when it is available (see setup.py)
+try:
+    from minimal_agents.utils._parsing_c import (
+        find_observation_boundary as _find_observation_boundary,
+        iter_sections as _iter_sections,
+        sections_from_positions as _sections_from_positions,
+        slice_tool_call as _slice_tool_call
+    )
+except ImportError:  # Optional compiled extension
+    pass
\ No newline at end of file
@@ -1,5 +1,13 @@
 """Default prompt templates for MinimalAgents framework."""
 
+import string
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+# Placeholders understood by the pre-split renderer
+_PROMPT_FIELDS = frozenset({"today", "tool_description", "tool_names", "question", "previous_responses"})
+_FORMATTER = string.Formatter()
+
 # Default system prompt for agents
 DEFAULT_SYSTEM_PROMPT = """
 You are an Intelligent Agent Assistant that can both have normal conversations AND use tools to help solve problems.
@@ -51,4 +59,65 @@ Remember:
 
 Question: {question}
 {previous_responses}
-"""
\ No newline at end of file
+"""
+
+@lru_cache(maxsize=32)
+def split_prompt_template(template: str) -> Tuple[str, str]:
+    """Split a prompt template into its static prefix and per-query suffix.
+    
+    The suffix starts at the line containing the `{question}` placeholder, so
+    the prefix (date, tool descriptions, tool names) stays identical for every
+    call within a run and can be sent as a cacheable system message.
+    
+    Args:
+        template: Prompt template using the standard placeholders
+        
+    Returns:
+        Tuple of (prefix_template, suffix_template)
+    """
+    question_idx = template.find("{question}")
+    if question_idx == -1:
+        return template, ""
+    
+    line_start = template.rfind("\n", 0, question_idx) + 1
+    return template[:line_start], template[line_start:]
+
+@lru_cache(maxsize=32)
+def compile_prompt_template(template: str) -> Optional[Tuple[str, ...]]:
+    """Pre-split a prompt template so rendering does not re-parse it.
+    
+    Args:
+        template: Prompt template using `str.format` placeholders
+        
+    Returns:
+        Alternating literal and placeholder-name segments (literals at even
+        indices), or None if the template uses format features the fast
+        renderer does not handle (format specs, conversions, other fields)
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+        if len(parts) % 2:
+            parts[-1] += literal  # Escaped braces split one literal into several
+        else:
+            parts.append(literal)
+        if field_name is None:
+            continue
+        if format_spec or conversion or field_name not in _PROMPT_FIELDS:
+            return None
+        parts.append(field_name)
+    return tuple(parts)
+
+def render_prompt(template: str = DEFAULT_PROMPT_TEMPLATE, **fields: Any) -> str:
+    """Render a prompt template, equivalent to `template.format(**fields)`.
+    
+    Args:
+        template: Prompt template using `str.format` placeholders
+        **fields: Values for the template placeholders
+        
+    Returns:
+        The rendered prompt
+    """
+    parts = compile_prompt_template(template)
+    if parts is None:
+        return template.format(**fields)
+    return "".join(format(fields[part]) if i % 2 else part for i, part in enumerate(parts))
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional dependency for faster JSON decoding
+    orjson = None
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document.
+    
+    Args:
+        data: Raw JSON as text or bytes
+        
+    Returns:
+        The decoded Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
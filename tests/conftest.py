@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+
+import os
+import sys
+
+# Make the package importable without installing it
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
\ No newline at end of file
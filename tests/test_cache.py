@@ -0,0 +1,58 @@
+"""Tests for minimal_agents.llm.cache."""
+
+from minimal_agents.llm import cache as cache_module
+from minimal_agents.llm.cache import LLMResponseCache
+
+class _Clock:
+    """Controllable replacement for time.monotonic."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+def test_get_returns_stored_value_and_counts_hits():
+    cache = LLMResponseCache()
+    assert cache.get("k") is None
+    cache.set("k", "v")
+    assert cache.get("k") == "v"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    cache = LLMResponseCache(ttl=10.0)
+    cache.set("k", "v")
+    clock.now += 9.9
+    assert cache.get("k") == "v"
+    clock.now += 0.2
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LLMResponseCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "b" is now the least recently used
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+def test_make_key_depends_on_every_request_field():
+    messages = [{"role": "user", "content": "hi"}]
+    key = LLMResponseCache.make_key(messages, "gpt-4o", 0.0, ["\nObservation:"], 100)
+    assert key == LLMResponseCache.make_key(list(messages), "gpt-4o", 0.0, ["\nObservation:"], 100)
+    assert key != LLMResponseCache.make_key(messages, "gpt-4o-mini", 0.0, ["\nObservation:"], 100)
+    assert key != LLMResponseCache.make_key(messages, "gpt-4o", 0.5, ["\nObservation:"], 100)
+    assert key != LLMResponseCache.make_key(messages, "gpt-4o", 0.0, None, 100)
+    assert key != LLMResponseCache.make_key(messages, "gpt-4o", 0.0, ["\nObservation:"], None)
+
+def test_clear_resets_entries_and_counters():
+    cache = LLMResponseCache()
+    cache.set("k", "v")
+    cache.get("k")
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""Tests for the client-side stop detection used by OpenAIProvider(stream=True)."""
+
+import pytest
+
+from minimal_agents.llm.openai import _StopDetector
+
+STOP = ["\nObservation:", "\n\tObservation:"]
+
+def _feed_all(detector, chunks):
+    """Feed chunks until a stop sequence is found; return how many were consumed."""
+    for count, chunk in enumerate(chunks, 1):
+        if detector.feed(chunk):
+            return count
+    return len(chunks)
+
+def test_text_without_stop_sequence_is_kept():
+    detector = _StopDetector(STOP)
+    assert _feed_all(detector, ["Action: A\n", "Action Input: 1"]) == 2
+    assert detector.text == "Action: A\nAction Input: 1"
+
+def test_stop_sequence_within_one_chunk():
+    detector = _StopDetector(STOP)
+    assert detector.feed("Action Input: 1\nObservation: 2")
+    assert detector.text == "Action Input: 1"
+
+@pytest.mark.parametrize("split", range(1, len("\nObservation:")))
+def test_stop_sequence_split_across_chunks(split):
+    stop_sequence = "\nObservation:"
+    chunks = ["Action Input: 1" + stop_sequence[:split], stop_sequence[split:] + " 2", " more"]
+    detector = _StopDetector(STOP)
+    assert _feed_all(detector, chunks) == 2
+    assert detector.text == "Action Input: 1"
+
+def test_earliest_stop_sequence_wins():
+    detector = _StopDetector(["B", "A"])
+    assert detector.feed("xxAyyB")
+    assert detector.text == "xx"
+
+def test_no_stop_sequences():
+    detector = _StopDetector()
+    assert not detector.feed("\nObservation: anything")
+    assert detector.text == "\nObservation: anything"
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""Tests for minimal_agents.utils.parsing."""
+
+import random
+import re
+
+import pytest
+
+from minimal_agents.utils import parsing
+from minimal_agents.utils.parsing import (
+    build_parser,
+    extract_chat_response,
+    extract_final_answer,
+    extract_observations,
+    extract_thoughts,
+    extract_tool_calls,
+    parse_response
+)
+
+# Fragments that produce every token, partial tokens and the characters the parser strips
+_PIECES = [
+    "Thought:", "Action:", "Action: ", "Action Input:", "Action Input: ", "Observation:",
+    "Observation: ", "Plan:", "Final Answer:", "Chat Response:", "\n", " ", "  ", "\n\n", "\t",
+    "foo", "[bar]", "\"q\"", "'x'", "]", "[", "Action:Action Input:", "é", "日本"
+]
+
+def _random_texts(seed: int, count: int = 3000):
+    """Yield random responses assembled from token fragments."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield "".join(rng.choice(_PIECES) for _ in range(rng.randint(0, 16)))
+
+# Reference implementations: the original regex/split based extractors
+
+def _ref_tool_calls(text):
+    match = re.search(
+        r"Action: [\[]?(.*?)[\]]?[\n]*Action Input:[\s]*(.*?)(?=\n\s*Observation:|\Z)", text, re.DOTALL
+    )
+    if not match:
+        return None, None
+    return match.group(1).strip(), match.group(2).strip(" \n\"'")
+
+def _ref_final_answer(text):
+    if "Final Answer:" not in text:
+        return None
+    return text.split("Final Answer:")[1].strip()
+
+def _ref_chat_response(text):
+    if "Chat Response:" not in text:
+        return None
+    return text.split("Chat Response:")[1].strip()
+
+def _ref_observations(text):
+    return [obs.strip() for obs in re.findall(r"Observation:(.*?)(?=Thought:|$)", text, re.DOTALL)]
+
+def _ref_thoughts(text):
+    pattern = r"Thought:(.*?)(?=Action:|Plan:|Final Answer:|$)"
+    return [thought.strip() for thought in re.findall(pattern, text, re.DOTALL)]
+
+@pytest.fixture(params=["hyperscan", "aho-corasick", "find"])
+def scan_backend(request, monkeypatch):
+    """Run a test once per available token scanning backend."""
+    if request.param == "hyperscan" and parsing._HYPERSCAN_DB is None:
+        pytest.skip("hyperscan is not installed")
+    if request.param == "aho-corasick":
+        if parsing._AUTOMATON is None:
+            pytest.skip("pyahocorasick is not installed")
+        monkeypatch.setattr(parsing, "_HYPERSCAN_DB", None)
+    if request.param == "find":
+        monkeypatch.setattr(parsing, "_HYPERSCAN_DB", None)
+        monkeypatch.setattr(parsing, "_AUTOMATON", None)
+    parse_response.cache_clear()
+    yield request.param
+    parse_response.cache_clear()
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_extractors_match_reference(seed):
+    for text in _random_texts(seed):
+        assert extract_tool_calls(text) == _ref_tool_calls(text), text
+        assert extract_final_answer(text) == _ref_final_answer(text), text
+        assert extract_chat_response(text) == _ref_chat_response(text), text
+        assert extract_observations(text) == _ref_observations(text), text
+        assert extract_thoughts(text) == _ref_thoughts(text), text
+
+@pytest.mark.parametrize("seed", [2, 3])
+def test_parse_response_matches_extractors(scan_backend, seed):
+    for text in _random_texts(seed):
+        parsed = parse_response(text)
+        assert parsed.final_answer == _ref_final_answer(text), text
+        assert parsed.chat_response == _ref_chat_response(text), text
+        assert parsed.tool_call == _ref_tool_calls(text), text
+        assert list(parsed.observations) == _ref_observations(text), text
+        assert list(parsed.thoughts) == _ref_thoughts(text), text
+        assert parsed.tool_index is None
+
+def test_scan_tokens_reports_every_occurrence(scan_backend):
+    text = "Thought: a\nAction: x\nAction Input: y\nObservation: z\nThought: b"
+    found = parsing.scan_tokens(text)
+    assert [token for token, _, _ in found] == [
+        "Thought:", "Action:", "Action Input:", "Observation:", "Thought:"
+    ]
+    for token, start, end in found:
+        assert text[start:end] == token
+
+def test_extracted_lists_are_independent_copies():
+    text = "Observation: a\nThought: b"
+    extract_observations(text).append("mutated")
+    assert extract_observations(text) == ["a"]
+
+def test_build_parser_resolves_tool_index():
+    parse = build_parser(("Python REPL", "Web Search", "File Reader"))
+    assert parse("Action: Web Search\nAction Input: cats").tool_index == 1
+    assert parse("Action: [File Reader]\nAction Input: a.txt").tool_index == 2
+    assert parse("Action: Unknown\nAction Input: x").tool_index is None
+    assert parse("Final Answer: done").tool_index is None
+
+def test_build_parser_duplicate_names_use_last_position():
+    parse = build_parser(("A", "B", "A"))
+    assert parse("Action: A\nAction Input: x").tool_index == 2
+    assert parse("Action: B\nAction Input: x").tool_index == 1
+
+@pytest.mark.parametrize("name", [
+    "it's", 'say "hi"', "back\\slash", "naïve", "{braces}", "tab\there", "'''", "x" * 200
+])
+def test_build_parser_handles_odd_names(name):
+    parse = build_parser(("other", name))
+    parsed = parse(f"Action: {name}\nAction Input: value")
+    assert parsed.tool_name == name.strip()
+    assert parsed.tool_index == 1
+    assert parse("Action: other\nAction Input: value").tool_index == 0
+
+def test_build_parser_matches_parse_response_apart_from_index():
+    parse = build_parser(("foo", "bar]"))
+    for text in _random_texts(4, count=1000):
+        parsed = parse(text)
+        expected = parse_response(text)
+        assert parsed.tool_call == expected.tool_call
+        assert parsed.final_answer == expected.final_answer
+        assert parsed.observations == expected.observations
+        assert parsed.thoughts == expected.thoughts
+        assert (parsed.tool_index is not None) == (parsed.tool_name in ("foo", "bar]"))
+
+def test_build_parser_caches_results():
+    parse = build_parser(("foo",))
+    text = "Action: foo\nAction Input: 1"
+    assert parse(text) is parse(text)
\ No newline at end of file
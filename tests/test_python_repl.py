@@ -0,0 +1,77 @@
+"""Tests for minimal_agents.tools.code.python_repl."""
+
+import asyncio
+import signal
+import sys
+import threading
+import time
+
+import pytest
+
+from minimal_agents.tools.code.python_repl import PythonREPL
+
+LOOP_FOREVER = "while True:\n    pass"
+
+def test_output_is_captured_and_state_persists():
+    repl = PythonREPL()
+    assert repl.run("x = 20") == "Code executed successfully (no output)."
+    assert repl.run("```python\nprint(x + 1)\n```") == "21\n"
+
+def test_errors_are_returned():
+    assert PythonREPL().run("1 / 0") == "Error: division by zero"
+
+def test_namespace_does_not_expose_module_internals():
+    for name in ("ctypes", "_capture_stdout", "_time_limit", "_set_async_exc"):
+        assert PythonREPL().run(f"print({name})") == f"Error: name '{name}' is not defined"
+
+def test_timeout_in_main_thread():
+    repl = PythonREPL(timeout=0.2)
+    stdout = sys.stdout
+    started = time.monotonic()
+    assert repl.run(LOOP_FOREVER) == "Error: timeout after 0.2s"
+    assert time.monotonic() - started < 5
+    assert sys.stdout is stdout
+    assert repl.run("print('still usable')") == "still usable\n"
+
+def test_timeout_cannot_be_swallowed_by_except_exception():
+    repl = PythonREPL(timeout=0.2)
+    assert repl.run("try:\n    while True: pass\nexcept Exception:\n    pass") == "Error: timeout after 0.2s"
+
+def test_timeout_in_worker_thread():
+    results = []
+    worker = threading.Thread(target=lambda: results.append(PythonREPL(timeout=0.2).run(LOOP_FOREVER)))
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert results == ["Error: timeout after 0.2s"]
+
+def test_timeout_through_async_arun():
+    assert asyncio.run(PythonREPL(timeout=0.2).arun(LOOP_FOREVER)) == "Error: timeout after 0.2s"
+
+def test_concurrent_runs_capture_their_own_output():
+    repls = [PythonREPL() for _ in range(4)]
+    
+    async def run_all():
+        return await asyncio.gather(*(
+            repl.arun(f"import time\nfor i in range(3):\n    print({n}, i)\n    time.sleep(0.01)")
+            for n, repl in enumerate(repls)
+        ))
+    
+    outputs = asyncio.run(run_all())
+    assert outputs == [f"{n} 0\n{n} 1\n{n} 2\n" for n in range(4)]
+
+@pytest.mark.skipif(not hasattr(signal, "SIGALRM"), reason="requires SIGALRM")
+def test_existing_alarm_is_preserved():
+    fired = []
+    previous_handler = signal.signal(signal.SIGALRM, lambda signum, frame: fired.append(signum))
+    try:
+        signal.setitimer(signal.ITIMER_REAL, 1.0)
+        assert PythonREPL(timeout=0.2).run(LOOP_FOREVER) == "Error: timeout after 0.2s"
+        assert signal.getitimer(signal.ITIMER_REAL)[0] > 0
+        deadline = time.monotonic() + 5
+        while not fired and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert fired == [signal.SIGALRM]
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
\ No newline at end of file